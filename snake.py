@@ -17,8 +17,8 @@ from __future__ import annotations
 import os
 import sys
 import random
-from dataclasses import dataclass
-import math
+from collections import deque
+from itertools import islice
 
 # Try to import pygame with a friendly error if missing
 try:
@@ -27,6 +27,20 @@ except ImportError as e:
     print("This game requires the 'pygame' package. Install it with:\n  pip install pygame\n\nError:", e)
     sys.exit(1)
 
+# NumPy is optional: beeps and the death animation degrade gracefully
+# without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional too — without it the particle kernel falls back to
+# a masked NumPy update over the same arrays (see _advance_particles).
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # ---------------------------- Config ---------------------------------
 
 GRID_SIZE = 25           # pixel size of one cell
@@ -57,49 +71,103 @@ WIN_H = PLAY_H + MARGIN * 2 + 64  # space for HUD
 
 # ---------------------------- Helpers --------------------------------
 
-@dataclass(frozen=True)
-class Vec:
-    x: int
-    y: int
-
-    def __add__(self, other: "Vec") -> "Vec":
-        return Vec(self.x + other.x, self.y + other.y)
-
-UP    = Vec(0, -1)
-DOWN  = Vec(0, 1)
-LEFT  = Vec(-1, 0)
-RIGHT = Vec(1, 0)
+# Cells are packed into a single int (y * GRID_COLS + x) so that snake
+# membership is a byte load in a flat occupancy buffer instead of a
+# hash + eq on a dataclass. Directions are small indices paired so the
+# opposite of d is d ^ 1 (no dict lookup), with DELTA mapping each to
+# its packed-index offset.
+UP    = 0
+DOWN  = 1
+LEFT  = 2
+RIGHT = 3
+
+DELTA = (-GRID_COLS, GRID_COLS, -1, 1)
+
+
+def _advance_particles(xy, v, life, dt, gravity, drag):
+    # Advance all live particles in-place; returns how many are still alive.
+    alive = 0
+    for i in range(xy.shape[0]):
+        if life[i] <= 0.0:
+            continue
+        life[i] -= dt
+        xy[i, 0] += v[i, 0] * dt
+        xy[i, 1] += v[i, 1] * dt
+        v[i, 1] += gravity * dt
+        v[i, 0] *= drag
+        v[i, 1] *= drag
+        if life[i] > 0.0:
+            alive += 1
+    return alive
+
+
+if njit is not None:
+    _advance_particles = njit(cache=True, fastmath=True)(_advance_particles)
+else:
+    def _advance_particles(xy, v, life, dt, gravity, drag):  # noqa: F811
+        # Dependency-free variant: same update, expressed as masked
+        # whole-array ops instead of an interpreted per-particle loop.
+        mask = life > 0.0
+        life[mask] -= dt
+        xy[mask] += v[mask] * dt
+        v[mask, 1] += gravity * dt
+        v[mask] *= drag
+        return int(np.count_nonzero(life > 0.0))
 
-OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+# ---------------------------- Game -----------------------------------
 
-# Allow hashing of Vec for set membership
-Vec.__hash__ = lambda self: hash((self.x, self.y))
+# Sentinel for lazily created resources ("not built yet" vs "unavailable")
+_UNSET = object()
 
-# ---------------------------- Game -----------------------------------
 
 class SnakeGame:
     def __init__(self):
         pygame.init()
         pygame.display.set_caption("Snake — classic")
         self.screen = pygame.display.set_mode((WIN_W, WIN_H))
+        self._grid_bg = self._make_grid_bg()
         self.clock = pygame.time.Clock()
+        # Only queue the event types we actually handle; everything else
+        # (mouse motion, window/audio device chatter, ...) is dropped by
+        # SDL instead of being iterated and discarded every frame.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN])
+        # One pixel rect per cell, indexed by packed cell index — saves
+        # recomputing the same coordinates and Rect per block per frame,
+        # and the rects double as the dirty regions for presentation.
+        self._cell_rects = [
+            pygame.Rect(MARGIN + x * GRID_SIZE + 2, MARGIN + y * GRID_SIZE + 2,
+                        GRID_SIZE - 4, GRID_SIZE - 4)
+            for y in range(GRID_ROWS) for x in range(GRID_COLS)
+        ]
+        # Pre-rendered snake tiles: the rounded rect is rasterized once
+        # per color, then segments are pushed with a single blits() call
+        # instead of one draw.rect per segment per frame.
+        self._head_tile = self._make_tile(GREEN)
+        self._body_tile = self._make_tile(GREEN_D)
+        # Gameover dim overlay, built once and converted for fast blits
+        self._gameover_overlay = pygame.Surface((PLAY_W, PLAY_H), pygame.SRCALPHA).convert_alpha()
+        self._gameover_overlay.fill((0, 0, 0, 150))
         self.font = pygame.font.SysFont("consolas", 24)
-        self.font_big = pygame.font.SysFont("consolas", 42, bold=True)
-
-        # Optional sounds
+        self._font_big = None  # loaded on first menu/gameover draw
+        # Rendered-text cache: font.render rasterizes glyphs into a fresh
+        # Surface every call, so invariant strings are rendered once and
+        # reused. The HUD status line gets its own one-slot cache since
+        # its text changes with the score.
+        self._text_cache: dict = {}
+        self._hud_cache_key = None
+        self._hud_cache_surf = None
+
+        # Optional sounds. Fallback beeps are synthesized lazily on first
+        # playback so startup doesn't pay for waveform generation.
         self.sound_on = False
-        self.snd_eat = None
-        self.snd_die = None
+        self._snd_eat = None
+        self._snd_die = None
         try:
             pygame.mixer.init()
             self.sound_on = True
-            # Create fallback beeps if possible (do not disable sound if this fails)
-            try:
-                self.snd_eat = self._make_beep(600, 0.08)
-                self.snd_die = self._make_beep(120, 0.25)
-            except Exception:
-                self.snd_eat = None
-                self.snd_die = None
+            self._snd_eat = _UNSET
+            self._snd_die = _UNSET
         except Exception:
             self.sound_on = False
 
@@ -152,8 +220,13 @@ class SnakeGame:
             # Keep fallback beep
             pass
 
-        # Death animation state
-        self.death_particles = []
+        # Death animation state (struct-of-arrays; filled on game over)
+        self._p_xy = None
+        self._p_v = None
+        self._p_life = None
+        self._p_maxlife = None
+        self._p_col = None
+        self._p_n = 0
         self.death_anim_elapsed = 0.0
 
         # Best score persistence
@@ -168,14 +241,57 @@ class SnakeGame:
 
         self.reset()
 
+    @property
+    def font_big(self) -> pygame.font.Font:
+        if self._font_big is None:
+            self._font_big = pygame.font.SysFont("consolas", 42, bold=True)
+        return self._font_big
+
+    @property
+    def snd_eat(self):
+        # Build the fallback beep on first use (do not disable sound if this fails)
+        if self._snd_eat is _UNSET:
+            try:
+                self._snd_eat = self._make_beep(600, 0.08)
+            except Exception:
+                self._snd_eat = None
+        return self._snd_eat
+
+    @snd_eat.setter
+    def snd_eat(self, sound):
+        self._snd_eat = sound
+
+    @property
+    def snd_die(self):
+        if self._snd_die is _UNSET:
+            try:
+                self._snd_die = self._make_beep(120, 0.25)
+            except Exception:
+                self._snd_die = None
+        return self._snd_die
+
+    @property
+    def moves_per_sec(self) -> int:
+        return self._moves_per_sec
+
+    @moves_per_sec.setter
+    def moves_per_sec(self, value: int):
+        # Keep the per-step duration cached; the main loop reads it
+        # every frame while the speed only changes on eat or keypress.
+        self._moves_per_sec = value
+        self._step_len = 1.0 / value
+
     def reset(self, base_speed: int | None = None):
         cx = GRID_COLS // 2
         cy = GRID_ROWS // 2
         self.dir = RIGHT
         self.next_dir = RIGHT
         # Build initial snake centered, heading right
-        self.snake: list[Vec] = [Vec(cx - i, cy) for i in range(START_LENGTH)]
-        self.snake_set = set(self.snake)
+        start = cy * GRID_COLS + cx
+        self.snake: deque[int] = deque(start - i for i in range(START_LENGTH))
+        self.occupied = bytearray(GRID_COLS * GRID_ROWS)
+        for idx in self.snake:
+            self.occupied[idx] = 1
         self.grow = 0
         self.score = 0
         self.moves_per_sec = base_speed if base_speed is not None else TICK_RATE
@@ -183,24 +299,52 @@ class SnakeGame:
         self.alive = True
         self.paused = False
         self.time_since_step = 0.0
+        # Dirty-rect bookkeeping: cells touched since the last present,
+        # plus flags for the HUD strip and for a full-frame redraw.
+        self._dirty_cells: list[int] = []
+        self._hud_dirty = False
+        self._full_redraw = True
+        self._needs_redraw = True
+        self._last_mouse_pos = None
 
     def spawn_food(self):
-        empty = [(x, y) for x in range(GRID_COLS) for y in range(GRID_ROWS)
-                 if Vec(x, y) not in self.snake_set]
+        total = GRID_COLS * GRID_ROWS
+        if len(self.snake) < total // 2:
+            # Mostly-empty board: rejection sampling finds a free cell in
+            # ~1 expected try, no need to enumerate every empty cell.
+            for _ in range(64):
+                idx = random.randrange(total)
+                if not self.occupied[idx]:
+                    self.food = idx
+                    return
+        # Dense board (or pathological rejection streak): scan once.
+        if np is not None:
+            empty = np.flatnonzero(np.frombuffer(self.occupied, dtype=np.uint8) == 0)
+            if len(empty) == 0:
+                self.food = None
+                return
+            self.food = int(empty[random.randrange(len(empty))])
+            return
+        empty = [idx for idx in range(total) if not self.occupied[idx]]
         if not empty:
             self.food = None
             return
-        x, y = random.choice(empty)
-        self.food = Vec(x, y)
+        self.food = random.choice(empty)
 
     def _make_beep(self, freq: int, duration: float):
-        # Generate a simple square beep in a Sound object
-        import numpy as np
+        # Generate a simple square beep in a Sound object. A square wave
+        # is just a repeating high/low int16 pattern — tiling one period
+        # avoids the sin/threshold/float pipeline entirely.
         sample_rate = 22050
+        period = max(1, sample_rate // freq)
+        half = period // 2
+        amp = int(0.2 * (2**15 - 1))
+        pattern = np.empty(period, dtype=np.int16)
+        pattern[:half] = amp
+        pattern[half:] = -amp
         n = int(duration * sample_rate)
-        t = (np.arange(n) / sample_rate)
-        wave = ((np.sin(2 * np.pi * freq * t) > 0) * 2 - 1).astype("float32") * 0.2
-        return pygame.sndarray.make_sound((wave * (2**15 - 1)).astype("int16"))
+        wave = np.tile(pattern, n // period + 1)[:n]
+        return pygame.sndarray.make_sound(wave)
 
     def _play_sfx(self, sound: pygame.mixer.Sound | None):
         if not sound:
@@ -225,45 +369,50 @@ class SnakeGame:
         Preference order: a known filename placed by the user, then any mp3/ogg/wav/flac.
         """
         root = os.path.dirname(os.path.abspath(__file__))
-        preferred = [
-            "Lenny Pixels - Motherboard Encore - 8bit.mp3",
-        ]
-        for name in preferred:
-            path = os.path.join(root, name)
-            if os.path.isfile(path):
-                return path
+        preferred = {
+            "lenny pixels - motherboard encore - 8bit.mp3",
+        }
         exts = (".mp3", ".ogg", ".wav", ".flac", ".mod")
         try:
-            for fname in sorted(os.listdir(root)):
-                if fname.lower().endswith(exts):
-                    return os.path.join(root, fname)
+            # scandir caches the stat, so this is one syscall per entry
+            # (vs listdir + isfile), and each name is lowercased once.
+            with os.scandir(root) as it:
+                entries = [(e.name, e.name.lower()) for e in it if e.is_file()]
         except Exception:
-            pass
+            return None
+        for name, lower in entries:
+            if lower in preferred:
+                return os.path.join(root, name)
+        for name, lower in sorted(entries):
+            if lower.endswith(exts):
+                return os.path.join(root, name)
         return None
 
     def _find_explosion_file(self) -> str | None:
         """Find an explosion sfx in root; prefer names starting with 'explosion'."""
         root = os.path.dirname(os.path.abspath(__file__))
-        candidates: list[str] = []
+        exts = (".wav", ".ogg", ".mp3", ".flac")
+        candidates: list[tuple[str, str]] = []
         try:
-            for fname in os.listdir(root):
-                lower = fname.lower()
-                if any(lower.endswith(ext) for ext in (".wav", ".ogg", ".mp3", ".flac")):
-                    if lower.startswith("explosion") or "explosion" in lower:
-                        candidates.append(fname)
+            with os.scandir(root) as it:
+                for e in it:
+                    if not e.is_file():
+                        continue
+                    lower = e.name.lower()
+                    if lower.endswith(exts) and "explosion" in lower:
+                        candidates.append((e.name, lower))
         except Exception:
             return None
         if not candidates:
             return None
         # Prefer wav/ogg over mp3 for Sound compatibility
-        def rank(name: str) -> int:
-            n = name.lower()
-            if n.endswith(".wav"): return 0
-            if n.endswith(".ogg"): return 1
-            if n.endswith(".flac"): return 2
-            if n.endswith(".mp3"): return 3
+        def rank(lower: str) -> int:
+            if lower.endswith(".wav"): return 0
+            if lower.endswith(".ogg"): return 1
+            if lower.endswith(".flac"): return 2
+            if lower.endswith(".mp3"): return 3
             return 10
-        best = sorted(candidates, key=rank)[0]
+        best = min(candidates, key=lambda c: rank(c[1]))[0]
         return os.path.join(root, best)
 
     def _find_eat_file(self) -> str | None:
@@ -271,38 +420,41 @@ class SnakeGame:
         root = os.path.dirname(os.path.abspath(__file__))
         exts = (".wav", ".ogg", ".mp3", ".flac")
         keywords = ("eat", "pickup", "coin", "chomp", "bite", "point", "sfx", "sound")
-        candidates: list[str] = []
+        music_lower = os.path.basename(self.music_path).lower() if self.music_path else None
+        candidates: list[tuple[str, str]] = []
         try:
-            for fname in os.listdir(root):
-                lower = fname.lower()
-                if not any(lower.endswith(ext) for ext in exts):
-                    continue
-                # Skip music and explosion
-                if self.music_path and os.path.basename(self.music_path).lower() == lower:
-                    continue
-                if "explosion" in lower:
-                    continue
-                if any(k in lower for k in keywords):
-                    candidates.append(fname)
+            with os.scandir(root) as it:
+                for e in it:
+                    if not e.is_file():
+                        continue
+                    lower = e.name.lower()
+                    if not lower.endswith(exts):
+                        continue
+                    # Skip music and explosion
+                    if lower == music_lower or "explosion" in lower:
+                        continue
+                    if any(k in lower for k in keywords):
+                        candidates.append((e.name, lower))
         except Exception:
             return None
         if not candidates:
             return None
         # Prefer wav/ogg over mp3 for Sound compatibility
-        def rank(name: str) -> int:
-            n = name.lower()
-            if n.endswith(".wav"): return 0
-            if n.endswith(".ogg"): return 1
-            if n.endswith(".flac"): return 2
-            if n.endswith(".mp3"): return 3
+        def rank(lower: str) -> int:
+            if lower.endswith(".wav"): return 0
+            if lower.endswith(".ogg"): return 1
+            if lower.endswith(".flac"): return 2
+            if lower.endswith(".mp3"): return 3
             return 10
-        best = sorted(candidates, key=rank)[0]
+        best = min(candidates, key=lambda c: rank(c[1]))[0]
         return os.path.join(root, best)
 
     # ------------------------ Update & Logic -------------------------
 
     def handle_input(self):
-        for event in pygame.event.get():
+        queued_dir = None
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)):
+            self._needs_redraw = True
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit(0)
@@ -342,6 +494,7 @@ class SnakeGame:
                     elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                         self.state = "playing"
                         self.paused = False
+                        self._full_redraw = True
                         return
                     elif event.key in (pygame.K_m,):
                         self.sound_on = not self.sound_on
@@ -367,6 +520,7 @@ class SnakeGame:
                         elif self.state == "paused":
                             self.state = "playing"
                             self.paused = False
+                            self._full_redraw = True
                 if event.key in (pygame.K_m,):
                     self.sound_on = not self.sound_on
                     # Toggle music playback
@@ -385,6 +539,7 @@ class SnakeGame:
                     self.reset(base_speed=self.moves_per_sec)
                     self.state = "playing"
                     self.paused = False
+                    queued_dir = None  # restart discards earlier turns this frame
                     # Ensure music is playing after restart if sound is on
                     if self.music_loaded and self.sound_on:
                         try:
@@ -395,23 +550,29 @@ class SnakeGame:
                         except Exception:
                             pass
 
-                # Direction changes
+                # Direction changes — only the last valid one this frame
+                # matters, so collapse repeats into one queue_dir call below
+                d = None
                 if event.key in (pygame.K_UP, pygame.K_w):
-                    self.queue_dir(UP)
+                    d = UP
                 elif event.key in (pygame.K_DOWN, pygame.K_s):
-                    self.queue_dir(DOWN)
+                    d = DOWN
                 elif event.key in (pygame.K_LEFT, pygame.K_a):
-                    self.queue_dir(LEFT)
+                    d = LEFT
                 elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                    self.queue_dir(RIGHT)
+                    d = RIGHT
+                if d is not None and d != (self.dir ^ 1):
+                    queued_dir = d
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.state in ("menu", "paused"):
                     self.handle_menu_click(event.pos)
+        if queued_dir is not None:
+            self.queue_dir(queued_dir)
 
-    def queue_dir(self, d: Vec):
+    def queue_dir(self, d: int):
         if not self.alive:
             return
-        if d == OPPOSITE.get(self.dir):
+        if d == (self.dir ^ 1):
             return  # disallow 180 turns in one tick
         self.next_dir = d
 
@@ -420,21 +581,30 @@ class SnakeGame:
             return
         self.dir = self.next_dir
         head = self.snake[0]
-        new_head = head + self.dir
-
-        # Wall collision (classic — no wrap)
-        if not (0 <= new_head.x < GRID_COLS and 0 <= new_head.y < GRID_ROWS):
+        new_head = head + DELTA[self.dir]
+
+        # Wall collision (classic — no wrap). Horizontal moves wrap the
+        # packed index to the adjacent row, so check the column instead.
+        if self.dir == LEFT:
+            if head % GRID_COLS == 0:
+                self.game_over(); return
+        elif self.dir == RIGHT:
+            if head % GRID_COLS == GRID_COLS - 1:
+                self.game_over(); return
+        elif not (0 <= new_head < GRID_COLS * GRID_ROWS):
             self.game_over(); return
 
         # Self collision
-        if new_head in self.snake_set:
+        if self.occupied[new_head]:
             self.game_over(); return
 
         # Move
-        self.snake.insert(0, new_head)
-        self.snake_set.add(new_head)
+        self.snake.appendleft(new_head)
+        self.occupied[new_head] = 1
+        self._dirty_cells.append(head)  # old head is repainted in body color
+        self._dirty_cells.append(new_head)
 
-        if self.food and new_head == self.food:
+        if new_head == self.food:
             self.score += 1
             self.grow += 1
             if self.sound_on:
@@ -442,11 +612,15 @@ class SnakeGame:
             if self.score % SPEEDUP_EVERY == 0:
                 self.moves_per_sec += SPEEDUP_AMOUNT
             self.spawn_food()
+            if self.food is not None:
+                self._dirty_cells.append(self.food)
+            self._hud_dirty = True
         if self.grow > 0:
             self.grow -= 1
         else:
             tail = self.snake.pop()
-            self.snake_set.remove(tail)
+            self.occupied[tail] = 0
+            self._dirty_cells.append(tail)
 
     def game_over(self):
         self.alive = False
@@ -477,29 +651,43 @@ class SnakeGame:
 
     # --------------------------- Draw --------------------------------
 
-    def draw_grid(self):
-        # Background
-        self.screen.fill(BG_DARK)
+    def _make_grid_bg(self) -> pygame.Surface:
+        # Pre-render the static background + grid once; the grid never
+        # changes, so redrawing ~50 lines per frame is wasted work.
+        bg = pygame.Surface((WIN_W, WIN_H))
+        bg.fill(BG_DARK)
         # Playfield
         pf_rect = pygame.Rect(MARGIN, MARGIN, PLAY_W, PLAY_H)
-        pygame.draw.rect(self.screen, BLACK, pf_rect, border_radius=10)
+        pygame.draw.rect(bg, BLACK, pf_rect, border_radius=10)
 
         # Subtle grid lines
         for x in range(GRID_COLS + 1):
             px = MARGIN + x * GRID_SIZE
-            pygame.draw.line(self.screen, (30, 33, 38), (px, MARGIN), (px, MARGIN + PLAY_H))
+            pygame.draw.line(bg, (30, 33, 38), (px, MARGIN), (px, MARGIN + PLAY_H))
         for y in range(GRID_ROWS + 1):
             py = MARGIN + y * GRID_SIZE
-            pygame.draw.line(self.screen, (30, 33, 38), (MARGIN, py), (MARGIN + PLAY_W, py))
-
-    def draw_block(self, cell: Vec, color, inset=2):
-        r = pygame.Rect(
-            MARGIN + cell.x * GRID_SIZE + inset,
-            MARGIN + cell.y * GRID_SIZE + inset,
-            GRID_SIZE - inset * 2,
-            GRID_SIZE - inset * 2,
-        )
-        pygame.draw.rect(self.screen, color, r, border_radius=6)
+            pygame.draw.line(bg, (30, 33, 38), (MARGIN, py), (MARGIN + PLAY_W, py))
+        return bg.convert()
+
+    def draw_grid(self):
+        self.screen.blit(self._grid_bg, (0, 0))
+
+    def _text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        # Memoized font.render for strings that repeat across frames
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def _make_tile(self, color) -> pygame.Surface:
+        tile = pygame.Surface((GRID_SIZE - 4, GRID_SIZE - 4), pygame.SRCALPHA)
+        pygame.draw.rect(tile, color, tile.get_rect(), border_radius=6)
+        return tile.convert_alpha()
+
+    def draw_block(self, idx: int, color):
+        pygame.draw.rect(self.screen, color, self._cell_rects[idx], border_radius=6)
 
     def draw(self):
         if self.state in ("menu", "paused"):
@@ -514,35 +702,61 @@ class SnakeGame:
             pygame.display.flip()
             return
 
-        self.draw_grid()
+        if self.state == "gameover" or self._full_redraw:
+            self.draw_grid()
+
+            # Skip drawing entities on Game Over screen
+            if self.state != "gameover":
+                # Food
+                if self.food is not None:
+                    self.draw_block(self.food, RED)
 
-        # Skip drawing entities on Game Over screen
-        if self.state != "gameover":
-            # Food
-            if self.food:
-                self.draw_block(self.food, RED)
+                # Snake — one C-level blits() call for the whole body
+                self.screen.blits([(self._body_tile, self._cell_rects[c])
+                                   for c in islice(self.snake, 1, None)])
+                self.screen.blit(self._head_tile, self._cell_rects[self.snake[0]])
 
-            # Snake
-            for i, c in enumerate(self.snake):
-                color = GREEN if i == 0 else GREEN_D
-                self.draw_block(c, color)
+            # HUD
+            self._draw_hud()
 
-        # HUD
-        self._draw_hud()
+            # Game over overlay (only after death animation completes)
+            if self.state == "gameover":
+                self.screen.blit(self._gameover_overlay, (MARGIN, MARGIN))
+                text = self._text(self.font_big, "GAME OVER", YELLOW)
+                sub = self._text(self.font, "Press R to restart", WHITE)
+                self.screen.blit(text, (MARGIN + (PLAY_W - text.get_width()) // 2,
+                                        MARGIN + (PLAY_H - text.get_height()) // 2 - 12))
+                self.screen.blit(sub, (MARGIN + (PLAY_W - sub.get_width()) // 2,
+                                       MARGIN + (PLAY_H - sub.get_height()) // 2 + 28))
 
-        # Game over overlay (only after death animation completes)
-        if self.state == "gameover":
-            overlay = pygame.Surface((PLAY_W, PLAY_H), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            self.screen.blit(overlay, (MARGIN, MARGIN))
-            text = self.font_big.render("GAME OVER", True, YELLOW)
-            sub = self.font.render("Press R to restart", True, WHITE)
-            self.screen.blit(text, (MARGIN + (PLAY_W - text.get_width()) // 2,
-                                    MARGIN + (PLAY_H - text.get_height()) // 2 - 12))
-            self.screen.blit(sub, (MARGIN + (PLAY_W - sub.get_width()) // 2,
-                                   MARGIN + (PLAY_H - sub.get_height()) // 2 + 28))
+            pygame.display.flip()
+            self._full_redraw = False
+            self._dirty_cells.clear()
+            self._hud_dirty = False
+            return
 
-        pygame.display.flip()
+        # Incremental path: only the cells touched since the last frame
+        # (plus the HUD strip, when it changed) are repainted and pushed.
+        dirty_rects = []
+        for cell in self._dirty_cells:
+            r = self._cell_rects[cell]
+            self.screen.blit(self._grid_bg, r, r)
+            dirty_rects.append(r)
+        for cell in self._dirty_cells:
+            if cell == self.food:
+                self.draw_block(cell, RED)
+            elif self.occupied[cell]:
+                tile = self._head_tile if cell == self.snake[0] else self._body_tile
+                self.screen.blit(tile, self._cell_rects[cell])
+        if self._hud_dirty:
+            hud_rect = pygame.Rect(0, MARGIN + PLAY_H, WIN_W, WIN_H - MARGIN - PLAY_H)
+            self.screen.blit(self._grid_bg, hud_rect, hud_rect)
+            self._draw_hud()
+            dirty_rects.append(hud_rect)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        self._dirty_cells.clear()
+        self._hud_dirty = False
 
     # --------------------------- Menu ---------------------------------
 
@@ -570,8 +784,7 @@ class SnakeGame:
             "start": start_rect,
         }
 
-    def draw_button(self, rect: pygame.Rect, label: str, *, primary=False):
-        mouse_pos = pygame.mouse.get_pos()
+    def draw_button(self, rect: pygame.Rect, label: str, mouse_pos, *, primary=False):
         hovered = rect.collidepoint(mouse_pos)
         base = (60, 65, 72) if not primary else (76, 175, 80)
         base_hover = (80, 86, 94) if not primary else (56, 142, 60)
@@ -579,7 +792,7 @@ class SnakeGame:
         pygame.draw.rect(self.screen, color, rect, border_radius=8)
         pygame.draw.rect(self.screen, (30, 33, 38), rect, width=2, border_radius=8)
         text_color = WHITE if primary else WHITE
-        surf = self.font.render(label, True, text_color)
+        surf = self._text(self.font, label, text_color)
         self.screen.blit(surf, (rect.centerx - surf.get_width() // 2,
                                 rect.centery - surf.get_height() // 2))
 
@@ -590,22 +803,23 @@ class SnakeGame:
         pygame.draw.rect(self.screen, BLACK, panel, border_radius=12)
 
         layout = self.get_menu_layout()
+        mouse_pos = pygame.mouse.get_pos()  # one SDL query for all buttons
 
         # Title
         title_text = "SNAKE" if self.state == "menu" else "PAUSED"
-        title = self.font_big.render(title_text, True, YELLOW)
+        title = self._text(self.font_big, title_text, YELLOW)
         self.screen.blit(title, (panel.centerx - title.get_width() // 2, MARGIN + 40))
 
         # Speed label
         label_text = "Starting Speed (moves per second)" if self.state == "menu" else "Speed (moves per second)"
-        label = self.font.render(label_text, True, GRAY)
+        label = self._text(self.font, label_text, GRAY)
         self.screen.blit(label, (panel.centerx - label.get_width() // 2, MARGIN + 120))
 
         # Speed controls
-        self.draw_button(layout["minus"], "−")
-        self.draw_button(layout["plus"], "+")
+        self.draw_button(layout["minus"], "−", mouse_pos)
+        self.draw_button(layout["plus"], "+", mouse_pos)
         current_speed = self.menu_speed if self.state == "menu" else int(self.moves_per_sec)
-        val_surf = self.font.render(str(current_speed), True, WHITE)
+        val_surf = self._text(self.font, str(current_speed), WHITE)
         pygame.draw.rect(self.screen, (40, 44, 52), layout["speed_value"], border_radius=8)
         pygame.draw.rect(self.screen, (30, 33, 38), layout["speed_value"], width=2, border_radius=8)
         self.screen.blit(val_surf, (layout["speed_value"].centerx - val_surf.get_width() // 2,
@@ -613,7 +827,7 @@ class SnakeGame:
 
         # Start button
         btn_label = "Start" if self.state == "menu" else "Resume"
-        self.draw_button(layout["start"], btn_label, primary=True)
+        self.draw_button(layout["start"], btn_label, mouse_pos, primary=True)
 
         # Footer help (wrapped if too wide)
         help_line = (
@@ -647,6 +861,7 @@ class SnakeGame:
             else:
                 self.state = "playing"
                 self.paused = False
+                self._full_redraw = True
 
     def start_game(self):
         # Begin playing with chosen speed
@@ -667,11 +882,14 @@ class SnakeGame:
     def run(self):
         step_timer = 0.0
         while True:
-            dt = self.clock.tick(60) / 1000.0  # seconds since last frame
+            # Idle screens don't need 60 FPS — halve the pace and skip
+            # redraws while nothing on them has changed.
+            target_fps = 60 if self.state in ("playing", "dying") else 20
+            dt = self.clock.tick(target_fps) / 1000.0  # seconds since last frame
             self.handle_input()
             if self.state == "playing":
                 step_timer += dt
-                step_len = 1.0 / float(self.moves_per_sec)
+                step_len = self._step_len
                 while step_timer >= step_len:
                     self.step()
                     step_timer -= step_len
@@ -679,20 +897,34 @@ class SnakeGame:
                 if self._update_death(dt):
                     # Transition to gameover screen after animation
                     self.state = "gameover"
+                    self._needs_redraw = True
+            if self.state in ("menu", "paused", "gameover"):
+                mouse_pos = pygame.mouse.get_pos()
+                if mouse_pos != self._last_mouse_pos:
+                    self._last_mouse_pos = mouse_pos
+                    if self.state != "gameover":
+                        # Button hover highlights track the cursor
+                        self._needs_redraw = True
+                if not self._needs_redraw:
+                    continue
+                self._needs_redraw = False
             self.draw()
 
     # --------------------------- HUD/Helpers -------------------------
 
     def _draw_hud(self):
         hud_y = MARGIN + PLAY_H + 8
-        msg = f"Score: {self.score}    Best: {self.best}    Speed: {self.moves_per_sec}"
-        if self.state == "paused":
-            msg += "    [PAUSED]"
-        surf = self.font.render(msg, True, WHITE)
-        self.screen.blit(surf, (MARGIN, hud_y))
+        key = (self.score, self.best, self.moves_per_sec, self.state == "paused")
+        if key != self._hud_cache_key:
+            msg = f"Score: {self.score}    Best: {self.best}    Speed: {self.moves_per_sec}"
+            if self.state == "paused":
+                msg += "    [PAUSED]"
+            self._hud_cache_surf = self.font.render(msg, True, WHITE)
+            self._hud_cache_key = key
+        self.screen.blit(self._hud_cache_surf, (MARGIN, hud_y))
 
         help_line = "Arrows/WASD move • P pause • R restart • M sound • ESC quit"
-        help_s = self.font.render(help_line, True, GRAY)
+        help_s = self._text(self.font, help_line, GRAY)
         self.screen.blit(help_s, (MARGIN, hud_y + 26))
 
     def _draw_centered_wrapped(self, text: str, *, y_bottom: int, color, max_width: int, line_spacing: int = 2):
@@ -704,8 +936,7 @@ class SnakeGame:
         cur = ""
         for w in words:
             trial = (cur + " " + w).strip()
-            surf = self.font.render(trial, True, color)
-            if surf.get_width() <= max_width or not cur:
+            if self.font.size(trial)[0] <= max_width or not cur:
                 cur = trial
             else:
                 lines.append(cur)
@@ -714,7 +945,7 @@ class SnakeGame:
             lines.append(cur)
 
         # Compute total height
-        line_surfs = [self.font.render(line, True, color) for line in lines]
+        line_surfs = [self._text(self.font, line, color) for line in lines]
         total_h = sum(s.get_height() for s in line_surfs) + line_spacing * (len(line_surfs) - 1)
         y = y_bottom - total_h
         for s in line_surfs:
@@ -724,59 +955,52 @@ class SnakeGame:
     # --------------------- Death Animation ---------------------------
 
     def _create_death_particles(self):
-        self.death_particles.clear()
-        rng = random.Random()
-        # Generate particles from each snake segment
-        for i, c in enumerate(self.snake):
-            cx = MARGIN + c.x * GRID_SIZE + GRID_SIZE / 2
-            cy = MARGIN + c.y * GRID_SIZE + GRID_SIZE / 2
-            n = 3 + (1 if i == 0 else 0)  # head slightly more
-            for _ in range(n):
-                angle = rng.uniform(0, 2 * 3.1415926)
-                speed = rng.uniform(80, 220)
-                vx = speed * float(math.cos(angle))
-                vy = speed * float(math.sin(angle))
-                life = rng.uniform(0.6, 1.2)
-                col = GREEN if i == 0 else GREEN_D
-                self.death_particles.append({
-                    "x": cx,
-                    "y": cy,
-                    "vx": vx,
-                    "vy": vy,
-                    "life": life,
-                    "max_life": life,
-                    "col": col,
-                })
+        # Generate particles from each snake segment (head slightly more).
+        # The whole burst is drawn in one NumPy batch instead of per-
+        # particle trig and uniform() calls in a Python loop.
+        counts = np.full(len(self.snake), 3)
+        counts[0] = 4
+        total = int(counts.sum())
+
+        cells = np.fromiter(self.snake, dtype=np.int64, count=len(self.snake))
+        seg_cells = np.repeat(cells, counts)
+        self._p_xy = np.empty((total, 2), dtype=np.float32)
+        self._p_xy[:, 0] = MARGIN + (seg_cells % GRID_COLS) * GRID_SIZE + GRID_SIZE / 2
+        self._p_xy[:, 1] = MARGIN + (seg_cells // GRID_COLS) * GRID_SIZE + GRID_SIZE / 2
+
+        angles = np.random.uniform(0.0, 2 * np.pi, total)
+        speeds = np.random.uniform(80.0, 220.0, total)
+        self._p_v = np.empty((total, 2), dtype=np.float32)
+        self._p_v[:, 0] = speeds * np.cos(angles)
+        self._p_v[:, 1] = speeds * np.sin(angles)
+
+        self._p_life = np.random.uniform(0.6, 1.2, total).astype(np.float32)
+        self._p_maxlife = self._p_life.copy()
+        self._p_col = np.full((total, 3), GREEN_D, dtype=np.uint8)
+        self._p_col[:4] = GREEN  # the head's particles come first
+        self._p_n = total
 
     def _update_death(self, dt: float) -> bool:
         # Returns True when the animation is finished
         self.death_anim_elapsed += dt
-        still_alive = 0
-        gravity = 380.0
-        drag = 0.98
-        for p in self.death_particles:
-            if p["life"] <= 0:
-                continue
-            p["life"] -= dt
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            p["vy"] += gravity * dt
-            p["vx"] *= drag
-            p["vy"] *= drag
-            if p["life"] > 0:
-                still_alive += 1
+        if self._p_n == 0:
+            return True
+        still_alive = _advance_particles(self._p_xy, self._p_v, self._p_life,
+                                         dt, 380.0, 0.98)
         # Finish when no particles alive or after 1.6s
         return still_alive == 0 or self.death_anim_elapsed >= 1.6
 
     def _draw_death_particles(self):
-        for p in self.death_particles:
-            if p["life"] <= 0:
+        size = max(2, int(GRID_SIZE * 0.22))
+        for i in range(self._p_n):
+            life = self._p_life[i]
+            if life <= 0:
                 continue
-            t = max(0.0, min(1.0, p["life"] / p["max_life"]))
-            col = p["col"]
+            t = max(0.0, min(1.0, life / self._p_maxlife[i]))
+            col = self._p_col[i]
             color = (int(col[0] * t + 10), int(col[1] * t + 10), int(col[2] * t + 10))
-            size = max(2, int(GRID_SIZE * 0.22))
-            r = pygame.Rect(int(p["x"]) - size // 2, int(p["y"]) - size // 2, size, size)
+            r = pygame.Rect(int(self._p_xy[i, 0]) - size // 2,
+                            int(self._p_xy[i, 1]) - size // 2, size, size)
             pygame.draw.rect(self.screen, color, r, border_radius=3)
 
 # ---------------------------- Entry ----------------------------------